@@ -1,10 +1,13 @@
+import asyncio
 import logging
 import sys
 
 from importlib_metadata import metadata
 
-from github_actions_docs.cli import build_args_parser
-from github_actions_docs.lib.generator import generate_docs
+from github_actions_docs.cli import build_args_parser, validate_args
+from github_actions_docs.lib.generator import generate_docs, generate_refs_docs
+from github_actions_docs.lib.pipeline import generate_docs_async
+from github_actions_docs.lib.watcher import watch_docs
 
 __version__ = metadata("github-actions-docs")["Version"]
 logging.basicConfig(stream=sys.stdout, level=logging.INFO)
@@ -14,23 +17,57 @@ def main():
     """main"""
     description = metadata("github-actions-docs")["Summary"]
     version = "%(prog)s {}".format(__version__)
-    args = build_args_parser(description=description, version=version).parse_args()
+    parser = build_args_parser(description=description, version=version)
+    args = parser.parse_args()
+    validate_args(parser, args)
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
         logging.getLogger().handlers = [logging.StreamHandler(sys.stderr)]
     elif args.ignore:
         logging.getLogger().setLevel(logging.WARNING)
-    exit_code = generate_docs(
-        file_paths=args.input_files_path,
-        output_mode=args.output_mode,
-        docs_filename=args.docs_filename,
-        usage_ref_override=args.usage_ref_override,
-        tag_prefix=args.tag_prefix,
-        ignore=args.ignore,
-        dry_run=args.dry_run,
-        show_diff=args.show_diff,
-        generation_mode=args.generation_mode,
-    )
+    docs_filename = args.docs_filename or ["README.md"]
+    if args.refs:
+        exit_code = generate_refs_docs(
+            file_paths=args.input_files_path,
+            refs=args.refs,
+            refs_docs_dir=args.refs_docs_dir,
+            output_mode=args.output_mode,
+            docs_filename=docs_filename,
+            usage_ref_override=args.usage_ref_override,
+            tag_prefix=args.tag_prefix,
+            ignore=args.ignore,
+            dry_run=args.dry_run,
+            show_diff=args.show_diff,
+        )
+    else:
+        options = dict(
+            output_mode=args.output_mode,
+            docs_filename=docs_filename,
+            usage_ref_override=args.usage_ref_override,
+            tag_prefix=args.tag_prefix,
+            ignore=args.ignore,
+            dry_run=args.dry_run,
+            show_diff=args.show_diff,
+            generation_mode=args.generation_mode,
+            workflows_docs_dir=args.workflows_docs_dir,
+            usage_ref_strategy=args.usage_ref_strategy,
+            fingerprint=args.fingerprint,
+        )
+        if args.watch:
+            exit_code = watch_docs(file_paths=args.input_files_path, **options)
+        elif args.concurrency > 0:
+            exit_code = asyncio.run(
+                generate_docs_async(
+                    file_paths=args.input_files_path,
+                    catalog=args.catalog,
+                    concurrency=args.concurrency,
+                    **options,
+                )
+            )
+        else:
+            exit_code = generate_docs(
+                file_paths=args.input_files_path, catalog=args.catalog, **options
+            )
     sys.exit(exit_code)
 
 
@@ -1,5 +1,19 @@
 import argparse
 
+GENERATION_MODES = ["inline", "block"]
+# options which would be silently dropped by each of these modes
+UNSUPPORTED_OPTIONS = {
+    "refs": [
+        "watch",
+        "concurrency",
+        "catalog",
+        "fingerprint",
+        "workflows_docs_dir",
+        "usage_ref_strategy",
+    ],
+    "watch": ["concurrency", "catalog"],
+}
+
 
 def build_args_parser(description: str, version: str) -> argparse.ArgumentParser:
     """
@@ -31,11 +45,30 @@ def build_args_parser(description: str, version: str) -> argparse.ArgumentParser
         action="store_true",
         help="Show diff between existing file and the newly generated one.",
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and regenerate the docs of input files on change,\
+                invalid files are skipped as with --ignore.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=0,
+        help="Overlap reads, git lookups, parsing and writes of up to this many\
+                files using an asyncio pipeline, 0 processes files one by one.",
+    )
     parser.add_argument(
         "--ignore",
         action="store_true",
         help="Silently ignore the invalid files.",
     )
+    parser.add_argument(
+        "--fingerprint",
+        action="store_true",
+        help="Embed a fingerprint of the input in the docs and skip unchanged files\
+                without parsing them.",
+    )
     parser.add_argument(
         "--tag-prefix",
         type=str,
@@ -52,15 +85,45 @@ def build_args_parser(description: str, version: str) -> argparse.ArgumentParser
     parser.add_argument(
         "--generation-mode",
         nargs="?",
-        choices=["inline", "block"],
+        choices=GENERATION_MODES,
         default="inline",
         help="Whether to create tags inline (more flexibility but more noise).",
     )
     parser.add_argument(
         "--docs-filename",
+        type=docs_target,
+        action="append",
+        help="Creates or updates output on the same path as the input (README.md\
+                if not given). Can be repeated to write several targets from one\
+                parse, each as FILENAME[:TAG_PREFIX].",
+    )
+    parser.add_argument(
+        "--workflows-docs-dir",
+        type=str,
+        default="",
+        help="Write one file per reusable workflow into this directory, with the\
+                table of contents in --docs-filename of the same directory.",
+    )
+    parser.add_argument(
+        "--catalog",
+        type=str,
+        default="",
+        help="Also write a JSON catalog of every processed file to this path,\
+                streamed as JSON Lines if it ends with .jsonl.",
+    )
+    parser.add_argument(
+        "--refs",
+        type=lambda value: [i for i in value.split(",") if i],
+        default=[],
+        help="Comma separated git refs (e.g. tags) to generate docs for, read\
+                directly from git objects. Inputs are then patterns relative to\
+                the repository root.",
+    )
+    parser.add_argument(
+        "--refs-docs-dir",
         type=str,
-        default="README.md",
-        help="Creates or updates output on the same path as the input.",
+        default="docs/refs",
+        help="Directory of the docs generated with --refs, one subdirectory per ref.",
     )
     parser.add_argument(
         "--usage-ref-override",
@@ -69,6 +132,14 @@ def build_args_parser(description: str, version: str) -> argparse.ArgumentParser
         help="Override the uses reference in usage section.\
                 By default latest tag or current branch name will be used.",
     )
+    parser.add_argument(
+        "--usage-ref-strategy",
+        nargs="?",
+        choices=["latest", "last-commit"],
+        default="latest",
+        help="Reference used in usage section: latest tag (or current branch) or\
+                the last commit touching the directory of each file.",
+    )
     parser.add_argument(
         "input_files_path",
         nargs="+",
@@ -76,3 +147,23 @@ def build_args_parser(description: str, version: str) -> argparse.ArgumentParser
         help="Path (or glob) of github action or reusable workflow file(s).",
     )
     return parser
+
+
+def validate_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Exits with an error if an option is not supported in the selected mode."""
+    for mode, options in UNSUPPORTED_OPTIONS.items():
+        if not getattr(args, mode):
+            continue
+        for option in options:
+            if getattr(args, option) != parser.get_default(option):
+                parser.error(
+                    f"--{option.replace('_', '-')} is not supported with --{mode}"
+                )
+
+
+def docs_target(value: str) -> str:
+    """Validates `FILENAME[:TAG_PREFIX]`."""
+    filename, *options = value.split(":")
+    if not filename or len(options) > 1:
+        raise argparse.ArgumentTypeError(f"invalid docs target: {value}")
+    return value
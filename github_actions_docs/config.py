@@ -55,9 +55,32 @@ DOCS_TEMPLATE_WORKFLOW_ITEM = """## <!-- {prefix}_NAME_ITEM_ID -->
 <!-- {prefix}_USAGE_ITEM_ID -->
 """
 
+DOCS_TEMPLATE_WORKFLOW_SHARD = """# <!-- {prefix}_NAME -->
+
+<!-- {prefix}_DESCRIPTION -->
+
+## Inputs
+
+<!-- {prefix}_INPUTS -->
+
+## Secrets
+
+<!-- {prefix}_SECRETS -->
+
+## Outputs
+
+<!-- {prefix}_OUTPUTS -->
+
+## Usage
+
+<!-- {prefix}_USAGE -->
+"""
+
 DOCS_TEMPLATES = {
     "composite": DOCS_TEMPLATE_ACTION,
     "generic": DOCS_TEMPLATE_ACTION,
     "reusable workflow": DOCS_TEMPLATE_WORKFLOW,
     "reusable workflow item": DOCS_TEMPLATE_WORKFLOW_ITEM,
+    "reusable workflow index": DOCS_TEMPLATE_WORKFLOW,
+    "reusable workflow shard": DOCS_TEMPLATE_WORKFLOW_SHARD,
 }
@@ -0,0 +1,51 @@
+import json
+import pathlib
+
+from github_actions_docs.lib.styler import UpdateDocsStyle
+
+
+class Catalog:
+    """Machine readable catalog of every processed action and workflow.
+
+    Written as a JSON list, or streamed item by item as JSON Lines if the file
+    name ends with `.jsonl`.
+    """
+
+    def __init__(self, catalog_path: str) -> None:
+        self.catalog_path = pathlib.Path(catalog_path)
+        self.items = []
+        self.stream = None
+        if self.catalog_path.suffix == ".jsonl":
+            self.stream = open(self.catalog_path, "w")
+
+    def add(self, yaml_path: pathlib.Path, styler: UpdateDocsStyle) -> None:
+        item = catalog_item(yaml_path, styler)
+        if self.stream:
+            self.stream.write(json.dumps(item) + "\n")
+            self.stream.flush()
+        else:
+            self.items.append(item)
+
+    def close(self) -> None:
+        if self.stream:
+            self.stream.close()
+        else:
+            with open(self.catalog_path, "w") as f:
+                json.dump(self.items, f, indent=2)
+                f.write("\n")
+
+
+def catalog_item(yaml_path: pathlib.Path, styler: UpdateDocsStyle) -> dict:
+    """Creates catalog entry from the already parsed and styled file."""
+    result = {
+        "name": styler.action_name,
+        "description": styler.docs["description"].strip(),
+        "path": yaml_path.as_posix(),
+        "runs": styler.action_type,
+    }
+    for key in ["inputs", "outputs", "secrets"]:
+        table = styler.tables.get(key, {"header": [], "content": []})
+        result[key] = [dict(zip(table["header"], row)) for row in table["content"]]
+    result["uses"] = styler.uses
+    result["usage_ref"] = styler.usage_ref
+    return result
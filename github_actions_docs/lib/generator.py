@@ -1,15 +1,24 @@
+import copy
 import difflib
+import hashlib
 import logging
+import os
 import pathlib
 import re
 import tempfile
+from fnmatch import fnmatch
 from glob import glob
 
+from importlib_metadata import version
+
 from github_actions_docs.config import DOCS_TEMPLATES
 from github_actions_docs.errors import (
     GithubActionsDocsError,
     GithubActionsDocsSchemaError,
 )
+from github_actions_docs.lib.catalog import Catalog
+from github_actions_docs.lib.git import Git, GitObjects
+from github_actions_docs.lib.lock import docs_file_lock
 from github_actions_docs.lib.parser import GithubActions
 from github_actions_docs.lib.styler import UpdateDocsStyle
 from pygments import highlight
@@ -20,13 +29,18 @@ from pygments.lexers import DiffLexer, MarkdownLexer
 def generate_docs(
     file_paths: list,
     output_mode: str = "inject",
-    docs_filename: str = "README.md",
+    docs_filename: str | list = "README.md",
     usage_ref_override: str = "",
     tag_prefix: str = "GH_DOCS",
     ignore: bool = False,
     dry_run: bool = False,
     show_diff: bool = False,
     generation_mode="inline",
+    workflows_docs_dir: str = "",
+    usage_ref_strategy: str = "latest",
+    fingerprint: bool = False,
+    catalog: str = "",
+    git: Git | None = None,
 ) -> int:
     """
     Args:
@@ -34,24 +48,66 @@ def generate_docs(
         output_mode: inject to the existing docs_filename or create new based on the
             DOCS_TEMPLATE_ACTION
         docs_filename: name of the markdown file which will be created next to the
-            input file.
+            input file. A list creates several targets from the same parsed file,
+            each one as `FILENAME[:TAG_PREFIX]`.
         usage_ref_override: If empty tries to use the latest git tag and then
             branch name.
         tag_prefix: sections are designated by comments in markdown file. This
             parameter controls the prefix of those comments.
         ignore: continue if any one of the input files are not a valid github
             action or a workflow.
+        generation_mode: not applied yet, every target is generated inline.
+        workflows_docs_dir: if set, every reusable workflow gets its own markdown
+            file in this directory and docs_filename in the same directory only
+            holds the table of contents.
+        usage_ref_strategy: `latest` uses the latest git tag and then branch name,
+            `last-commit` pins every file to the last commit touching its
+            directory. Ignored if usage_ref_override is set.
+        fingerprint: embed a fingerprint of the input file, the version and the
+            options in the docs, files with matching fingerprint are skipped
+            without being parsed. Refs resolved from git are not part of it.
+        catalog: path of a JSON (or JSON Lines if it ends with `.jsonl`) file
+            listing every processed file, built from the same parsed data.
+            Files are never skipped by fingerprint while it is generated.
+        git: reuse the git metadata of a previous run (e.g. in watch mode).
 
     Returns:
         exit code, 1 if any of input files has been changed, 0 if no change.
     """
-    if dry_run:
-        docs_root_path = pathlib.Path(tempfile.mkdtemp())
-    file_paths = [pathlib.Path(j) for i in file_paths for j in glob(i)]
-    file_paths = list(set(file_paths))  # remove duplicates
-    changed_files = []
+    docs_root_path = pathlib.Path(tempfile.mkdtemp()) if dry_run else None
+    file_paths = expand_file_paths(file_paths)
+    docs_targets = parse_docs_targets(docs_filename, tag_prefix)
+    fingerprint_options = create_fingerprint_options(
+        output_mode,
+        docs_targets,
+        usage_ref_override,
+        workflows_docs_dir,
+        usage_ref_strategy,
+    )
+    docs_catalog = Catalog(catalog) if catalog else None
+    sources = []
     for path in file_paths:
+        source_fingerprint, skip = "", False
+        if fingerprint and path.is_file():
+            source_fingerprint = create_fingerprint(path, fingerprint_options)
+            skip = not docs_catalog and all(
+                fingerprint_matches(path, source_fingerprint, i, workflows_docs_dir, j)
+                for i, j in docs_targets
+            )
+        sources.append((path, source_fingerprint, skip))
+    last_commits = {}
+    if usage_ref_strategy == "last-commit" and not usage_ref_override:
+        # only files which are not skipped by their fingerprint need git
+        if paths := [str(path.parent) for path, _, skip in sources if not skip]:
+            git = git or Git()
+            last_commits = git.last_commits(paths)
+    changed_files = []
+    for path, source_fingerprint, skip in sources:
         logging.debug(f"evaluating: {path}")
+        if skip:
+            logging.info(f"no change (fingerprint): {path}")
+            changed_files.append(False)
+            continue
         try:
             github_actions = GithubActions(path)
             parsed_yaml = github_actions.parse()
@@ -59,68 +115,339 @@ def generate_docs(
         except (GithubActionsDocsError, GithubActionsDocsSchemaError, KeyError) as e:
             if not ignore:
                 logging.error(f"ignoring invalid file: {path}\n  reason: {e}")
+                if docs_catalog:
+                    docs_catalog.close()
                 return 1
             logging.debug(f"ignoring invalid file: {path}\n  reason: {e}")
             continue  # it's not a valid github action or reusable workflow file
 
-        UpdateDocsStyle(parsed_yaml, github_actions.yaml_path, usage_ref_override)
+        usage_ref = usage_ref_override or last_commits.get(str(path.parent)) or ""
+        git = git or Git()
+        styler = UpdateDocsStyle(parsed_yaml, github_actions.yaml_path, usage_ref, git)
+        if docs_catalog:
+            docs_catalog.add(github_actions.yaml_path, styler)
+
+        changed_file = output_docs_targets(
+            parsed_yaml,
+            github_actions.yaml_path,
+            action_type,
+            docs_targets,
+            output_mode,
+            workflows_docs_dir,
+            dry_run,
+            show_diff,
+            docs_root_path,
+            source_fingerprint,
+        )
+        changed_files.append(changed_file)
+        if changed_file:
+            logging.info(f"changed for file: {github_actions.yaml_path}")
+        else:
+            logging.info(f"no change: {github_actions.yaml_path}")
+    if docs_catalog:
+        docs_catalog.close()
+    if dry_run:
+        logging.debug(
+            f"number of processed files: {sum(changed_files)}/{len(file_paths)}"
+        )
+    else:
+        logging.debug(
+            f"number of changed files: {sum(changed_files)}/{len(file_paths)}"
+        )
+    return 1 if any(changed_files) else 0
+
+
+def generate_refs_docs(
+    file_paths: list,
+    refs: list,
+    refs_docs_dir: str = "docs/refs",
+    output_mode: str = "inject",
+    docs_filename: str | list = "README.md",
+    usage_ref_override: str = "",
+    tag_prefix: str = "GH_DOCS",
+    ignore: bool = False,
+    dry_run: bool = False,
+    show_diff: bool = False,
+) -> int:
+    """Generates docs for the given git refs without checking them out.
+
+    Files are read from the git object database, docs of every ref are written
+    under `{refs_docs_dir}/{ref}/` mirroring the repository layout. Blobs which
+    are identical across refs are loaded only once.
+
+    Args:
+        file_paths: patterns (fnmatch) of files relative to the repository root.
+        refs: list of git refs, e.g. released tags.
+        refs_docs_dir: root directory of the generated docs.
+        usage_ref_override: If empty the ref itself will be used.
+        For the rest check `generate_docs`.
+
+    Returns:
+        exit code, 1 if any of docs files has been changed, 0 if no change.
+    """
+    docs_root_path = pathlib.Path(tempfile.mkdtemp()) if dry_run else None
+    docs_targets = parse_docs_targets(docs_filename, tag_prefix=tag_prefix)
+    invalid_file_errors = (
+        GithubActionsDocsError,
+        GithubActionsDocsSchemaError,
+        KeyError,
+        UnicodeDecodeError,
+    )
+    loaded_blobs = {}
+    changed_files = []
+    git = Git()
+    with GitObjects() as git_objects:
+        for ref in refs:
+            for object_id, path in git_objects.list_files(ref):
+                if not any(fnmatch(path, pattern) for pattern in file_paths):
+                    continue
+                logging.debug(f"evaluating: {ref}:{path}")
+                yaml_path = pathlib.Path(path)
+                if object_id not in loaded_blobs:
+                    # invalid blobs are cached too, so they are read only once
+                    try:
+                        loaded_blobs[object_id] = GithubActions(
+                            yaml_path, git_objects.read_blob(object_id).decode()
+                        )
+                    except invalid_file_errors as e:
+                        loaded_blobs[object_id] = e
+                try:
+                    if isinstance(loaded_blobs[object_id], Exception):
+                        raise loaded_blobs[object_id]
+                    github_actions = copy.copy(loaded_blobs[object_id])
+                    github_actions.yaml_path = yaml_path
+                    parsed_yaml = github_actions.parse()
+                    action_type = parsed_yaml["runs"]
+                except invalid_file_errors as e:
+                    if not ignore:
+                        logging.error(
+                            f"ignoring invalid file: {ref}:{path}\n  reason: {e}"
+                        )
+                        return 1
+                    logging.debug(f"ignoring invalid file: {ref}:{path}\n  reason: {e}")
+                    continue
+
+                UpdateDocsStyle(parsed_yaml, yaml_path, usage_ref_override or ref, git)
+
+                changed_file = False
+                for target_filename, target_tag_prefix in docs_targets:
+                    docs_path = pathlib.Path(refs_docs_dir, ref, path).parent.joinpath(
+                        target_filename
+                    )
+                    changed_file |= output_docs_file(
+                        dict(parsed_yaml),
+                        yaml_path,
+                        docs_path,
+                        output_mode,
+                        action_type,
+                        target_tag_prefix,
+                        dry_run,
+                        show_diff,
+                        docs_root_path,
+                    )
+                changed_files.append(changed_file)
+                if changed_file:
+                    logging.info(f"changed for file: {ref}:{path}")
+                else:
+                    logging.info(f"no change: {ref}:{path}")
+    logging.debug(
+        f"number of changed files: {sum(changed_files)}/{len(changed_files)}, "
+        f"unique blobs: {len(loaded_blobs)}"
+    )
+    return 1 if any(changed_files) else 0
+
+
+def expand_file_paths(file_paths: list) -> list[pathlib.Path]:
+    """Expands globs of the input files."""
+    file_paths = [pathlib.Path(j) for i in file_paths for j in glob(i)]
+    return list(set(file_paths))  # remove duplicates
+
+
+def output_docs_targets(
+    parsed_yaml: dict,
+    yaml_path: pathlib.Path,
+    action_type: str,
+    docs_targets: list,
+    output_mode: str,
+    workflows_docs_dir: str = "",
+    dry_run: bool = False,
+    show_diff: bool = False,
+    docs_root_path: pathlib.Path | None = None,
+    fingerprint: str = "",
+) -> bool:
+    """Writes one styled file to every target, see `parse_docs_targets`.
+
+    Returns:
+        True if any of the docs files has been (or would have been) updated
+    """
+    changed_file = False
+    for index, (target_filename, target_tag_prefix) in enumerate(docs_targets):
+        if workflows_docs_dir and action_type == "reusable workflow":
+            # the first target keeps the plain shard name, e.g. `build.md`, the
+            # others add their own stem, e.g. `build.docs.md` for DOCS.md
+            shard_suffix = f".{pathlib.Path(target_filename).stem.lower()}"
+            targets = workflow_shard_targets(
+                parsed_yaml,
+                pathlib.Path(workflows_docs_dir),
+                target_filename,
+                yaml_path,
+                shard_suffix if index else "",
+            )
+        else:
+            docs_path = yaml_path.parent.joinpath(target_filename)
+            targets = [(docs_path, action_type, dict(parsed_yaml))]
+        for i, (existing_docs_path, target_type, docs_items) in enumerate(targets):
+            changed_file |= output_docs_file(
+                docs_items,
+                yaml_path,
+                existing_docs_path,
+                output_mode,
+                target_type,
+                target_tag_prefix,
+                dry_run,
+                show_diff,
+                docs_root_path,
+                # the last file is where the fingerprint is looked up
+                fingerprint if i == len(targets) - 1 else "",
+            )
+    return changed_file
+
+
+def output_docs_file(
+    docs_items: dict,
+    yaml_path: pathlib.Path,
+    existing_docs_path: pathlib.Path,
+    output_mode: str,
+    action_type: str,
+    tag_prefix: str = "GH_DOCS",
+    dry_run: bool = False,
+    show_diff: bool = False,
+    docs_root_path: pathlib.Path | None = None,
+    fingerprint: str = "",
+) -> bool:
+    """Generates one docs file and takes care of dry run and diff output.
 
-        # Setup output
-        existing_docs_path = github_actions.yaml_path.parent.joinpath(docs_filename)
+    Returns:
+        True if the file has been (or in dry run would have been) updated
+    """
+    # Everything from reading the existing file to writing the merged result
+    # happens under the lock, so parallel invocations sharing the same target
+    # (e.g. .github/workflows/README.md) merge their sections instead of
+    # overwriting each other.
+    with docs_file_lock(existing_docs_path):
         existing_file_content = ""
         if existing_docs_path.is_file():
             with open(existing_docs_path, "r") as f:
                 existing_file_content = f.read()
         if dry_run:
-            docs_path = docs_root_path.joinpath(f"{hash(path)}_{docs_filename}")
+            docs_path = docs_root_path.joinpath(
+                f"{hash(existing_docs_path)}_{existing_docs_path.name}"
+            )
             if existing_docs_path.is_file():
                 with open(docs_path, "w") as f:
                     f.write(existing_file_content)
         else:
-            docs_path = github_actions.yaml_path.parent.joinpath(docs_filename)
+            docs_path = existing_docs_path
+            docs_path.parent.mkdir(parents=True, exist_ok=True)
         # Generate changed file
         changed_file = create_or_update_docs_file(
-            parsed_yaml,
-            github_actions.yaml_path,
-            docs_filename,
+            docs_items,
+            yaml_path,
+            existing_docs_path.name,
             output_mode,
             action_type,
             docs_path,
             tag_prefix,
+            fingerprint,
         )
-        changed_files.append(changed_file)
         # Generate output
         with open(docs_path, "r") as f:
             new_file_content = f.read()
-        if dry_run:
-            if not show_diff:
-                print(new_file_content)
-                logging.info(f"file would have been written in: {existing_docs_path}")
-        if show_diff:
-            diff = "".join(
-                difflib.unified_diff(
-                    existing_file_content.splitlines(keepends=True),
-                    new_file_content.splitlines(keepends=True),
-                    n=10,
-                )
-            )
-            if not diff:
-                print("No changes to the existing file!")
-            else:
-                print(highlight(diff, DiffLexer(), Terminal256Formatter()))
-        if changed_file:
-            logging.info(f"changed for file: {github_actions.yaml_path}")
-        else:
-            logging.info(f"no change: {github_actions.yaml_path}")
     if dry_run:
-        logging.debug(
-            f"number of processed files: {sum(changed_files)}/{len(file_paths)}"
-        )
-    else:
-        logging.debug(
-            f"number of changed files: {sum(changed_files)}/{len(file_paths)}"
+        if not show_diff:
+            print(new_file_content)
+            logging.info(f"file would have been written in: {existing_docs_path}")
+    if show_diff:
+        diff = "".join(
+            difflib.unified_diff(
+                existing_file_content.splitlines(keepends=True),
+                new_file_content.splitlines(keepends=True),
+                n=10,
+            )
         )
-    return 1 if any(changed_files) else 0
+        if not diff:
+            print("No changes to the existing file!")
+        else:
+            print(highlight(diff, DiffLexer(), Terminal256Formatter()))
+    return changed_file
+
+
+def workflow_shard_targets(
+    docs_items: dict,
+    workflows_docs_dir: pathlib.Path,
+    index_filename: str,
+    yaml_path: pathlib.Path,
+    shard_suffix: str = "",
+) -> list:
+    """Splits a styled reusable workflow into its own docs file and an index entry.
+
+    The default description links the input file relative to the docs next to
+    it, in the shard it is linked relative to workflows_docs_dir instead. Shards
+    are named after the workflow, with `shard_suffix` appended so that each docs
+    target gets its own shard.
+
+    Returns:
+        list of (docs path, action type, docs items) tuples, shard first.
+    """
+    shard_filename = f"{workflow_item_id(docs_items['name']).lower()}{shard_suffix}.md"
+    index_items = {
+        "title": docs_items["title"],
+        "contents_table_title": docs_items["contents_table_title"],
+        "contents_table_item": f"- [{docs_items['name']}]({shard_filename})\n",
+    }
+    shard_items = {
+        key: value
+        for key, value in docs_items.items()
+        if key not in {"title", "contents_table_title", "contents_table_item"}
+    }
+    relative_yaml_path = pathlib.Path(
+        os.path.relpath(yaml_path, workflows_docs_dir)
+    ).as_posix()
+    shard_items["description"] = shard_items["description"].replace(
+        f"[{yaml_path}]({yaml_path.name})", f"[{yaml_path}]({relative_yaml_path})"
+    )
+    return [
+        (
+            workflows_docs_dir.joinpath(shard_filename),
+            "reusable workflow shard",
+            shard_items,
+        ),
+        (
+            workflows_docs_dir.joinpath(index_filename),
+            "reusable workflow index",
+            index_items,
+        ),
+    ]
+
+
+def parse_docs_targets(docs_filename: str | list, tag_prefix: str = "GH_DOCS") -> list:
+    """Splits `FILENAME[:TAG_PREFIX]` targets.
+
+    Returns:
+        list of (filename, tag prefix), the given tag_prefix is used if missing.
+    """
+    if isinstance(docs_filename, str):
+        docs_filename = [docs_filename]
+    result = []
+    for target in docs_filename:
+        filename, _, target_tag_prefix = target.partition(":")
+        result.append((filename, target_tag_prefix or tag_prefix))
+    return result
+
+
+def workflow_item_id(name: str) -> str:
+    """Identifier of a reusable workflow used in tags of the aggregated docs."""
+    return re.sub(r"[^a-z\d\s]", "", name.lower()).replace(" ", "_").upper()
 
 
 def create_or_update_docs_file(
@@ -131,8 +458,13 @@ def create_or_update_docs_file(
     action_type: str,
     docs_path: pathlib.Path,
     tag_prefix: str = "GH_DOCS",
+    fingerprint: str = "",
 ) -> bool:
     """
+    Args:
+        fingerprint: `{digest} {path}` of the input file to be stored at the head
+            of the file, see `create_fingerprint`.
+
     Returns:
         True if the file has been updated
     """
@@ -164,11 +496,7 @@ def create_or_update_docs_file(
             content = f.read()
 
     if action_type == "reusable workflow":
-        item_id = (
-            re.sub(r"[^a-z\d\s]", "", docs_items["name"].lower())
-            .replace(" ", "_")
-            .upper()
-        )
+        item_id = workflow_item_id(docs_items["name"])
         # Add if item_id wich represents the respective action does not exist
         if item_id not in content:
             with open(docs_path, "a+") as f:
@@ -182,8 +510,9 @@ def create_or_update_docs_file(
                 f.seek(0)
                 file_changed = True
                 content = f.read()
+    if action_type in ("reusable workflow", "reusable workflow index"):
         # Update table of contents
-        existing_table_of_contents = find_table_of_contents(content)
+        existing_table_of_contents = find_table_of_contents(content, tag_prefix)
         if docs_items["contents_table_item"] not in existing_table_of_contents:
             table_of_contents = (
                 existing_table_of_contents + docs_items["contents_table_item"]
@@ -199,6 +528,9 @@ def create_or_update_docs_file(
                 content, f"{item}_{item_id}", docs_items[item], tag_prefix
             )
 
+    if fingerprint:
+        content = update_fingerprint(content, fingerprint, tag_prefix)
+
     # Check if anything has changed
     with open(docs_path, "r") as f:
         old_content = f.read()
@@ -233,6 +565,97 @@ def replace_tags(
     return content
 
 
+def create_fingerprint_options(
+    output_mode: str,
+    docs_targets: list,
+    usage_ref_override: str,
+    workflows_docs_dir: str,
+    usage_ref_strategy: str,
+) -> list:
+    """Everything apart from the input file which affects the generated docs."""
+    return [
+        version("github-actions-docs"),
+        output_mode,
+        docs_targets,
+        usage_ref_override,
+        workflows_docs_dir,
+        usage_ref_strategy,
+    ]
+
+
+def create_fingerprint(
+    yaml_path: pathlib.Path, options: list, content: bytes | None = None
+) -> str:
+    """
+    Args:
+        content: content of the input file if it is already read.
+
+    Returns:
+        `{digest} {path}` where digest covers the content of the input file and
+        the options (including the version) used to generate its docs.
+    """
+    digest = hashlib.sha256(yaml_path.read_bytes() if content is None else content)
+    digest.update(repr(options).encode())
+    return f"{digest.hexdigest()} {yaml_path.as_posix()}"
+
+
+def fingerprint_matches(
+    yaml_path: pathlib.Path,
+    fingerprint: str,
+    docs_filename: str,
+    workflows_docs_dir: str = "",
+    tag_prefix: str = "GH_DOCS",
+) -> bool:
+    """Whether one of the docs files the input is written to holds fingerprint."""
+    docs_paths = [yaml_path.parent.joinpath(docs_filename)]
+    if workflows_docs_dir:
+        docs_paths.append(pathlib.Path(workflows_docs_dir, docs_filename))
+    return any(
+        read_fingerprints(i, tag_prefix).get(yaml_path.as_posix()) == fingerprint
+        for i in docs_paths
+    )
+
+
+def read_fingerprints(docs_path: pathlib.Path, tag_prefix: str = "GH_DOCS") -> dict:
+    """Reads only the fingerprint lines at the head of the docs file.
+
+    Returns:
+        {path: fingerprint} of every input file which contributed to the file.
+    """
+    result = {}
+    if not docs_path.is_file():
+        return result
+    with open(docs_path, "r") as f:
+        for line in f:
+            if not (match := fingerprint_pattern(tag_prefix).match(line)):
+                break
+            result[match.group(2)] = f"{match.group(1)} {match.group(2)}"
+    return result
+
+
+def update_fingerprint(
+    content: str, fingerprint: str, tag_prefix: str = "GH_DOCS"
+) -> str:
+    """Adds or replaces the fingerprint of one input file at the head of content."""
+    pattern = fingerprint_pattern(tag_prefix)
+    fingerprints = {}
+    lines = content.lstrip().splitlines(keepends=True)
+    while lines and (match := pattern.match(lines[0])):
+        fingerprints[match.group(2)] = f"{match.group(1)} {match.group(2)}"
+        lines.pop(0)
+    fingerprints[fingerprint.split(" ", 1)[1]] = fingerprint
+    head = "".join(
+        f"<!-- {tag_prefix}_FINGERPRINT {fingerprints[i]} -->\n"
+        for i in sorted(fingerprints)
+    )
+    return head + "".join(lines)
+
+
+def fingerprint_pattern(tag_prefix: str = "GH_DOCS") -> re.Pattern:
+    """Matches `<!-- {prefix}_FINGERPRINT {digest} {path} -->` lines."""
+    return re.compile(rf"<!-- {tag_prefix}_FINGERPRINT ([0-9a-f]+) (.+) -->\n?$")
+
+
 def find_table_of_contents(content: str, tag_prefix: str = "GH_DOCS") -> str:
     """ """
     identifier = f"{tag_prefix}_CONTENTS_TABLE_ITEM"
@@ -1,10 +1,23 @@
+import asyncio
+import functools
+import json
+import pathlib
 import subprocess
 
 from github_actions_docs.errors import GithubActionsDocsError
 
+LATEST_TAG_COMMAND = (
+    "git for-each-ref --sort=-version:refname --format '%(refname)' refs/tags --count=1"
+)
+REMOTE_URL_COMMAND = "git ls-remote --get-url origin"
+CURRENT_BRANCH_COMMAND = "git rev-parse --abbrev-ref HEAD"
+
 
 class Git:
-    """Basic git commands"""
+    """Basic git commands
+
+    Repository metadata (tag, remote, branch) is read once per instance.
+    """
 
     def __init__(self):
         self._run_command("git")
@@ -22,30 +35,196 @@ class Git:
             return None
         raise GithubActionsDocsError(f"Unkown git issue running: {command}")
 
-    @property
+    @functools.cached_property
     def latest_tag(self) -> str | None:
-        result = self._run_command(
-            "git for-each-ref --sort=-version:refname --format '%(refname)' refs/tags --count=1"
-        )
+        return self._parse_latest_tag(self._run_command(LATEST_TAG_COMMAND))
+
+    @functools.cached_property
+    def remote_url(self) -> str | None:
+        return self._parse_remote_url(self._run_command(REMOTE_URL_COMMAND))
+
+    @functools.cached_property
+    def current_branch(self) -> str | None:
+        return self._run_command(CURRENT_BRANCH_COMMAND)
+
+    @staticmethod
+    def _parse_latest_tag(result: str | None) -> str | None:
         try:
             return result.split("/")[2]
         except (IndexError, AttributeError):
             return None
         raise GithubActionsDocsError("unkown git issue getting latest git tag")
 
-    @property
-    def remote_url(self) -> str | None:
-        result = self._run_command("git ls-remote --get-url origin")
+    @staticmethod
+    def _parse_remote_url(result: str | None) -> str | None:
         try:
             return "/".join(result.replace(":", "/").split("/")[-2:]).rstrip(".git")
         except (IndexError, AttributeError):
             return None
         raise GithubActionsDocsError("unkown git issue getting git remote url")
 
-    @property
-    def current_branch(self) -> str | None:
-        return self._run_command("git rev-parse --abbrev-ref HEAD")
+    async def _run_command_async(self, command: str) -> str | None:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command.split(),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError:
+            raise GithubActionsDocsError(f"{command} is not an executable.")
+        stdout, _ = await process.communicate()
+        if process.returncode:
+            return None
+        return stdout.decode("ascii").strip("'\" \n")
+
+    async def prefetch(self) -> None:
+        """Reads repository metadata with concurrent subprocesses."""
+        latest_tag, remote_url, current_branch = await asyncio.gather(
+            self._run_command_async(LATEST_TAG_COMMAND),
+            self._run_command_async(REMOTE_URL_COMMAND),
+            self._run_command_async(CURRENT_BRANCH_COMMAND),
+        )
+        self.latest_tag = self._parse_latest_tag(latest_tag)
+        self.remote_url = self._parse_remote_url(remote_url)
+        self.current_branch = current_branch
 
     @property
     def revision_short_hash(self) -> str:
         return self._run_command("git rev-parse --short HEAD")
+
+    def last_commits(self, paths: list) -> dict:
+        """Finds the last commit touching each of the given directories.
+
+        All directories are resolved in a single walk of the history which stops
+        as soon as every one of them is found. Results are cached per HEAD in
+        the git directory, so following runs only walk for new directories.
+
+        Returns:
+            commit sha for each path, None if it has no history or it is outside
+            of the repository.
+        """
+        head = self._run_command("git rev-parse HEAD")
+        top_level = self._run_command("git rev-parse --show-toplevel")
+        git_dir = self._run_command("git rev-parse --absolute-git-dir")
+        if not (head and top_level and git_dir):
+            return {}
+        relative_paths = {}
+        for path in paths:
+            try:
+                relative_paths[path] = (
+                    pathlib.Path(path).resolve().relative_to(top_level).as_posix()
+                )
+            except ValueError:
+                relative_paths[path] = None  # outside of the repository
+
+        cache_path = pathlib.Path(git_dir).joinpath("github-actions-docs-cache.json")
+        try:
+            cache = json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            cache = {}
+        if cache.get("head") != head:
+            cache = {"head": head, "last_commits": {}}
+        missing = set(relative_paths.values()) - set(cache["last_commits"]) - {None}
+        if missing:
+            cache["last_commits"].update(self._walk_history(top_level, missing))
+            try:
+                cache_path.write_text(json.dumps(cache))
+            except OSError:
+                pass
+        return {
+            path: cache["last_commits"].get(relative_path) if relative_path else None
+            for path, relative_path in relative_paths.items()
+        }
+
+    def _walk_history(self, top_level: str, directories: set) -> dict:
+        """One `git log --name-only` pass assigning commits to directories."""
+        result = dict.fromkeys(directories)
+        remaining = set(directories)
+        command = ["git", "log", "--format=%x00%H", "--name-only", "HEAD", "--"]
+        process = subprocess.Popen(
+            command + sorted(directories),
+            cwd=top_level,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        commit = None
+        for line in process.stdout:
+            line = line.rstrip("\n")
+            if line.startswith("\0"):
+                commit = line[1:]
+                continue
+            if not line:
+                continue
+            for directory in list(remaining):
+                if directory == "." or f"{line}/".startswith(f"{directory}/"):
+                    result[directory] = commit
+                    remaining.remove(directory)
+            if not remaining:
+                break
+        process.stdout.close()
+        process.terminate()
+        process.wait()
+        return result
+
+
+class GitObjects:
+    """Reads files of any ref straight from the object database.
+
+    A single long-lived `git cat-file --batch` process serves every blob, so
+    nothing is checked out and the worktree is never touched.
+    """
+
+    def __init__(self):
+        try:
+            self.cat_file = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError:
+            raise GithubActionsDocsError("git is not an executable.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.cat_file.stdin.close()
+        self.cat_file.wait()
+
+    def list_files(self, ref: str) -> list[tuple[str, str]]:
+        """
+        Returns:
+            (object id, path) of every blob in the tree of ref, paths are
+            relative to the root of the repository.
+        """
+        try:
+            output = subprocess.check_output(
+                ["git", "ls-tree", "-r", "-z", "--full-tree", ref],
+                stderr=subprocess.DEVNULL,
+            )
+        except subprocess.CalledProcessError:
+            raise GithubActionsDocsError(f"{ref} is not a valid git ref.")
+        result = []
+        for entry in output.decode().split("\0"):
+            if not entry:
+                continue
+            info, path = entry.split("\t", 1)
+            _, object_type, object_id = info.split()
+            if object_type == "blob":
+                result.append((object_id, path))
+        return result
+
+    def read_blob(self, object_id: str) -> bytes:
+        self.cat_file.stdin.write(f"{object_id}\n".encode())
+        self.cat_file.stdin.flush()
+        header = self.cat_file.stdout.readline().decode().split()
+        if len(header) != 3:
+            raise GithubActionsDocsError(f"git object {object_id} is missing.")
+        content = self.cat_file.stdout.read(int(header[2]))
+        self.cat_file.stdout.read(1)  # trailing newline
+        return content
@@ -0,0 +1,39 @@
+import contextlib
+import hashlib
+import pathlib
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # windows
+    fcntl = None
+    import msvcrt
+
+
+@contextlib.contextmanager
+def docs_file_lock(docs_path: pathlib.Path):
+    """Advisory lock held while a docs file is read, merged and written.
+
+    Concurrent invocations (e.g. parallel pre-commit processes) updating the
+    same aggregated README are serialized on this lock, everything else still
+    runs in parallel. The lock file lives in the temp directory so nothing is
+    left next to the generated docs.
+    """
+    digest = hashlib.sha1(str(docs_path.resolve()).encode()).hexdigest()
+    lock_path = pathlib.Path(tempfile.gettempdir()).joinpath(
+        f"github-actions-docs-{digest}.lock"
+    )
+    with open(lock_path, "a+") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
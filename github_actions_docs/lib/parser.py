@@ -15,17 +15,26 @@ from ruamel.yaml import YAML
 
 
 class GithubActions:
-    def __init__(self, yaml_path: pathlib.Path) -> None:
+    def __init__(self, yaml_path: pathlib.Path, content: str | None = None) -> None:
+        """
+        Args:
+            yaml_path: path of the github action or reusable workflow file.
+            content: content of the file, if given yaml_path is not read from
+                the disk (e.g. when it comes from a git object).
+        """
         self.yaml_path = yaml_path
         # validate file
-        if not self.yaml_path.is_file():
+        if content is None and not self.yaml_path.is_file():
             raise GithubActionsDocsError(f"file {yaml_path} does not exist")
         if self.yaml_path.suffix not in [".yaml", ".yml"]:
             raise GithubActionsDocsError(f"{self.yaml_path.suffix} not accepted.")
         # load content
-        with open(yaml_path, "r") as f:
-            yaml = YAML(pure=True)
-            self.yaml_content = yaml.load(f)
+        yaml = YAML(pure=True)
+        if content is None:
+            with open(yaml_path, "r") as f:
+                self.yaml_content = yaml.load(f)
+        else:
+            self.yaml_content = yaml.load(content)
         # validate content
         if not self.yaml_content:
             raise GithubActionsDocsError("file doesn't seem to be a valid yaml file.")
@@ -49,11 +58,18 @@ class GithubActions:
             result["contents_table_title"] = GH_DOCS_WORKFLOWS_TABLE_OF_CONTENT_TITLE
         return result
 
+    def _find_triggers(self) -> dict:
+        """`on` as {event: configuration}, it can also be a list or a single event"""
+        triggers = self.yaml_content.get("on")
+        if isinstance(triggers, str):
+            return {triggers: None}
+        if isinstance(triggers, list):
+            return dict.fromkeys(triggers)
+        return triggers or {}
+
     def _find_action_type(self) -> str:
         yaml_content_keys = set(self.yaml_content.keys())
-        if "on" in yaml_content_keys and (
-            "workflow_call" in self.yaml_content["on"].keys()
-        ):
+        if "workflow_call" in self._find_triggers():
             action_type = "workflow"
             if not GHA_WORKFLOW_REQUIRED_FIELDS <= yaml_content_keys:
                 raise GithubActionsDocsSchemaError(
@@ -113,8 +129,9 @@ class GithubActions:
     def _parse_workflow(self) -> dict:
         result = {}
         result["runs"] = "reusable workflow"
+        workflow_call = self._find_triggers().get("workflow_call") or {}
         inputs, inputs_content = (
-            self.yaml_content["on"]["workflow_call"].get("inputs", {}),
+            workflow_call.get("inputs", {}),
             [],
         )
         for item, value in inputs.items():
@@ -139,7 +156,7 @@ class GithubActions:
             "content": inputs_content,
         }
         secrets, secrets_content = (
-            self.yaml_content["on"]["workflow_call"].get("secrets", {}),
+            workflow_call.get("secrets", {}),
             [],
         )
         for item, value in secrets.items():
@@ -155,7 +172,7 @@ class GithubActions:
             "content": secrets_content,
         }
         outputs, output_content = (
-            self.yaml_content["on"]["workflow_call"].get("outputs", {}),
+            workflow_call.get("outputs", {}),
             [],
         )
         for item, value in outputs.items():
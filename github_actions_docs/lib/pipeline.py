@@ -0,0 +1,211 @@
+import asyncio
+import logging
+import pathlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from github_actions_docs.errors import (
+    GithubActionsDocsError,
+    GithubActionsDocsSchemaError,
+)
+from github_actions_docs.lib.catalog import Catalog
+from github_actions_docs.lib.generator import (
+    create_fingerprint,
+    create_fingerprint_options,
+    expand_file_paths,
+    fingerprint_matches,
+    output_docs_targets,
+    parse_docs_targets,
+)
+from github_actions_docs.lib.git import Git
+from github_actions_docs.lib.parser import GithubActions
+from github_actions_docs.lib.styler import UpdateDocsStyle
+
+
+async def generate_docs_async(
+    file_paths: list,
+    output_mode: str = "inject",
+    docs_filename: str | list = "README.md",
+    usage_ref_override: str = "",
+    tag_prefix: str = "GH_DOCS",
+    ignore: bool = False,
+    dry_run: bool = False,
+    show_diff: bool = False,
+    generation_mode="inline",
+    workflows_docs_dir: str = "",
+    usage_ref_strategy: str = "latest",
+    fingerprint: bool = False,
+    catalog: str = "",
+    concurrency: int = 8,
+) -> int:
+    """Same as `generate_docs` but overlapping the I/O of different files.
+
+    Input files (and the fingerprints of their docs) are read ahead, git
+    metadata is resolved with concurrent subprocesses, parsing runs in a worker
+    thread and docs are written in the background. Stages are connected with
+    queues holding at most `concurrency` files. Docs are written, logged and
+    counted in the same order as `generate_docs` and the exit code is the same.
+
+    Existing docs are read and merged in the write stage, under the lock of
+    the docs file, so concurrent invocations still merge their sections.
+
+    Args:
+        concurrency: number of files each stage may run ahead of the next one.
+        For the rest check `generate_docs`.
+
+    Returns:
+        exit code, 1 if any of input files has been changed, 0 if no change.
+    """
+    docs_root_path = pathlib.Path(tempfile.mkdtemp()) if dry_run else None
+    file_paths = expand_file_paths(file_paths)
+    docs_targets = parse_docs_targets(docs_filename, tag_prefix)
+    fingerprint_options = create_fingerprint_options(
+        output_mode,
+        docs_targets,
+        usage_ref_override,
+        workflows_docs_dir,
+        usage_ref_strategy,
+    )
+    docs_catalog = Catalog(catalog) if catalog else None
+    skip_by_fingerprint = fingerprint and not docs_catalog
+
+    git = None  # created with the first file which isn't skipped
+    resolve_last_commits = (
+        usage_ref_strategy == "last-commit" and not usage_ref_override
+    )
+
+    def read_source(path: pathlib.Path) -> tuple:
+        """Reads the input file and looks up the fingerprints of its docs."""
+        if not path.is_file():
+            return None, "", False
+        content = path.read_bytes()
+        if not fingerprint:
+            return content, "", False
+        source_fingerprint = create_fingerprint(path, fingerprint_options, content)
+        skip = skip_by_fingerprint and all(
+            fingerprint_matches(path, source_fingerprint, i, workflows_docs_dir, j)
+            for i, j in docs_targets
+        )
+        return content, source_fingerprint, skip
+
+    def parse_source(path: pathlib.Path, content: bytes | None, usage_ref: str):
+        github_actions = GithubActions(
+            path, None if content is None else content.decode()
+        )
+        parsed_yaml = github_actions.parse()
+        action_type = parsed_yaml["runs"]
+        styler = UpdateDocsStyle(parsed_yaml, github_actions.yaml_path, usage_ref, git)
+        return github_actions, parsed_yaml, action_type, styler
+
+    sources = asyncio.Queue(maxsize=concurrency)
+    documents = asyncio.Queue(maxsize=concurrency)
+
+    async def read_sources() -> None:
+        for path in file_paths:
+            await sources.put(
+                (path, asyncio.create_task(asyncio.to_thread(read_source, path)))
+            )
+        await sources.put(None)
+
+    async def resolve_git(skipped: set) -> dict:
+        """Git metadata and last commits of every file not skipped so far."""
+        nonlocal git
+        git = Git()
+        git_metadata = asyncio.create_task(git.prefetch())
+        commits = {}
+        if resolve_last_commits:
+            paths = [str(path.parent) for path in file_paths if path not in skipped]
+            commits = await asyncio.to_thread(git.last_commits, paths)
+        await git_metadata
+        return commits
+
+    async def parse_sources(executor: ThreadPoolExecutor) -> None:
+        loop = asyncio.get_running_loop()
+        commits, skipped = None, set()
+        while item := await sources.get():
+            path, source = item
+            try:
+                content, source_fingerprint, skip = await source
+                if skip:
+                    skipped.add(path)
+                    await documents.put((path, None, source_fingerprint, True))
+                    continue
+                if commits is None:  # nothing is resolved if every file is skipped
+                    try:
+                        commits = await resolve_git(skipped)
+                    except Exception as e:  # not related to any input file
+                        await documents.put((None, e, "", False))
+                        return
+                usage_ref = usage_ref_override or commits.get(str(path.parent)) or ""
+                result = await loop.run_in_executor(
+                    executor, parse_source, path, content, usage_ref
+                )
+            except Exception as e:  # handed over to be raised in order
+                result, source_fingerprint, skip = e, "", False
+            await documents.put((path, result, source_fingerprint, skip))
+        await documents.put(None)
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    stages = [
+        asyncio.create_task(read_sources()),
+        asyncio.create_task(parse_sources(executor)),
+    ]
+    changed_files = []
+    try:
+        while item := await documents.get():
+            path, result, source_fingerprint, skip = item
+            if path is None:
+                raise result
+            logging.debug(f"evaluating: {path}")
+            if skip:
+                logging.info(f"no change (fingerprint): {path}")
+                changed_files.append(False)
+                continue
+            if isinstance(result, Exception):
+                if not isinstance(
+                    result,
+                    (GithubActionsDocsError, GithubActionsDocsSchemaError, KeyError),
+                ):
+                    raise result
+                if not ignore:
+                    logging.error(f"ignoring invalid file: {path}\n  reason: {result}")
+                    return 1
+                logging.debug(f"ignoring invalid file: {path}\n  reason: {result}")
+                continue  # it's not a valid github action or reusable workflow file
+
+            github_actions, parsed_yaml, action_type, styler = result
+            if docs_catalog:
+                docs_catalog.add(github_actions.yaml_path, styler)
+            changed_file = await asyncio.to_thread(
+                output_docs_targets,
+                parsed_yaml,
+                github_actions.yaml_path,
+                action_type,
+                docs_targets,
+                output_mode,
+                workflows_docs_dir,
+                dry_run,
+                show_diff,
+                docs_root_path,
+                source_fingerprint,
+            )
+            changed_files.append(changed_file)
+            if changed_file:
+                logging.info(f"changed for file: {github_actions.yaml_path}")
+            else:
+                logging.info(f"no change: {github_actions.yaml_path}")
+    finally:
+        for stage in stages:
+            stage.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+        if docs_catalog:
+            docs_catalog.close()
+    if dry_run:
+        logging.debug(
+            f"number of processed files: {sum(changed_files)}/{len(file_paths)}"
+        )
+    else:
+        logging.debug(
+            f"number of changed files: {sum(changed_files)}/{len(file_paths)}"
+        )
+    return 1 if any(changed_files) else 0
@@ -5,9 +5,13 @@ from github_actions_docs.lib.git import Git
 
 class UpdateDocsStyle:
     def __init__(
-        self, parsed_yaml: dict, yaml_path: str, usage_ref_override: str = ""
+        self,
+        parsed_yaml: dict,
+        yaml_path: str,
+        usage_ref_override: str = "",
+        git: Git | None = None,
     ) -> None:
-        self.git = Git()
+        self.git = git or Git()
         self.action_path = f"/{yaml_path.parent}"
         self.action_filename = (
             f"/{yaml_path.name}" if parsed_yaml["runs"] == "reusable workflow" else ""
@@ -17,6 +21,12 @@ class UpdateDocsStyle:
         self.inputs = parsed_yaml["inputs"]["content"]
         self.docs = parsed_yaml
         self.docs["usage"] = self._update_docs_usage(usage_ref_override)
+        # raw tables, kept before they get replaced by markdown
+        self.tables = {
+            key: self.docs[key]
+            for key in ["inputs", "outputs", "secrets"]
+            if key in self.docs
+        }
         self._update_docs_style()
 
     def _update_docs_usage(self, usage_ref_override: str = "") -> str:
@@ -36,11 +46,14 @@ class UpdateDocsStyle:
         Returns:
             yaml in form of string can be used directly in the output file.
         """
+        self.usage_ref = ""
         if remote_url := self.git.remote_url:
             ref = usage_ref_override or self.git.latest_tag or self.git.current_branch
             uses_result = f"{remote_url}{self.action_path}{self.action_filename}@{ref}"
+            self.usage_ref = ref
         else:
             uses_result = f"./.github/{self.action_path}{self.action_filename}"
+        self.uses = uses_result
         result = ""
         if self.action_type == "reusable workflow":
             result += "jobs:\n"
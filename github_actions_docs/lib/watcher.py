@@ -0,0 +1,92 @@
+import logging
+import pathlib
+import time
+from glob import glob
+
+from github_actions_docs.lib.generator import generate_docs
+from github_actions_docs.lib.git import Git
+
+
+class Watcher:
+    """Polls the input files (or yaml files inside input directories)."""
+
+    def __init__(self, file_paths: list) -> None:
+        self.file_paths = file_paths
+        self.snapshot = self._take_snapshot()
+
+    def _expand(self) -> list[pathlib.Path]:
+        result = []
+        for path in [pathlib.Path(j) for i in self.file_paths for j in glob(i)]:
+            if path.is_dir():
+                result += [i for i in path.rglob("*") if i.suffix in [".yaml", ".yml"]]
+            else:
+                result.append(path)
+        return result
+
+    def _take_snapshot(self) -> dict:
+        result = {}
+        for path in self._expand():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # removed in the meantime
+            result[path] = (stat.st_mtime_ns, stat.st_size)
+        return result
+
+    def poll(self) -> set:
+        """
+        Returns:
+            paths which have been created or modified since the last poll.
+        """
+        snapshot = self._take_snapshot()
+        changed = {i for i, j in snapshot.items() if self.snapshot.get(i) != j}
+        self.snapshot = snapshot
+        return changed
+
+
+def watch_docs(
+    file_paths: list, interval: float = 0.05, debounce: float = 0.05, **kwargs
+) -> int:
+    """Generates docs and keeps regenerating them for changed files.
+
+    Only the modified files are parsed again and only the docs depending on them
+    (including the shared reusable workflows readme) are updated. A burst of
+    saves is collected until nothing changes for `debounce` seconds. Git
+    metadata is read once and kept for the whole session. Invalid files (e.g.
+    dependabot.yml or non reusable workflows in a watched directory) are always
+    skipped, every changed file is generated on its own so a broken one (e.g.
+    in the middle of an edit) neither stops the others nor the session.
+
+    Args:
+        file_paths: paths, globs or directories to be watched.
+        interval: seconds between two polls.
+        debounce: seconds without further changes before regenerating.
+        kwargs: passed to `generate_docs`.
+
+    Returns:
+        exit code, 0 when interrupted.
+    """
+    kwargs["ignore"] = True
+    watcher = Watcher(file_paths)
+    git = Git()
+    changed = set(watcher.snapshot)
+    logging.info("watching for changes, press Ctrl+C to stop")
+    try:
+        while True:
+            if changed:
+                start = time.monotonic()
+                for path in sorted(changed):
+                    try:
+                        generate_docs(file_paths=[str(path)], git=git, **kwargs)
+                    except Exception as e:  # e.g. a half saved file, keep watching
+                        logging.error(f"failed to generate docs: {path}\n  reason: {e}")
+                logging.debug(
+                    f"regenerated {len(changed)} file(s) in "
+                    f"{(time.monotonic() - start) * 1000:.0f} ms"
+                )
+            time.sleep(interval)
+            if changed := watcher.poll():
+                while more := (time.sleep(debounce) or watcher.poll()):
+                    changed |= more
+    except KeyboardInterrupt:
+        return 0
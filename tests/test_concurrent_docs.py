@@ -0,0 +1,72 @@
+import os
+import pathlib
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+WORKFLOW_TEMPLATE = """name: Stress Workflow {index:02d}
+
+on:
+  workflow_call:
+    inputs:
+      value_{index:02d}:
+        required: false
+        default: "{index}"
+        type: string
+
+jobs:
+  example_job:
+    runs-on: ubuntu-latest
+    steps:
+      - run: echo {index}
+"""
+
+
+class TestConcurrentDocs(unittest.TestCase):
+    processes = 16
+
+    def setUp(self):
+        self.workflows_path = pathlib.Path(tempfile.mkdtemp())
+        for index in range(self.processes):
+            self.workflows_path.joinpath(f"workflow_{index:02d}.yaml").write_text(
+                WORKFLOW_TEMPLATE.format(index=index)
+            )
+
+    def tearDown(self):
+        shutil.rmtree(self.workflows_path)
+
+    def test_parallel_invocations_on_shared_readme(self):
+        env = dict(os.environ, PYTHONPATH=os.getcwd())
+        processes = [
+            subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "github_actions_docs",
+                    "--usage-ref-override=main",
+                    str(self.workflows_path.joinpath(f"workflow_{index:02d}.yaml")),
+                ],
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            for index in range(self.processes)
+        ]
+        exit_codes = [process.wait() for process in processes]
+        self.assertEqual(exit_codes, [1] * self.processes)  # every one changed it
+
+        content = self.workflows_path.joinpath("README.md").read_text()
+        self.assertEqual(content.count("<!-- BEGIN_GH_DOCS_TITLE -->"), 1)
+        for index in range(self.processes):
+            name = f"Stress Workflow {index:02d}"
+            anchor = f"stress-workflow-{index:02d}"
+            self.assertIn(f"- [{name}](#{anchor})\n", content)  # table of contents
+            tag = f"<!-- BEGIN_GH_DOCS_NAME_STRESS_WORKFLOW_{index:02d} -->"
+            self.assertEqual(content.count(tag), 1)  # exactly one section
+            self.assertIn(f'value_{index:02d}: "{index}"', content)  # usage
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,23 +1,47 @@
+import asyncio
 import filecmp
+import io
+import json
 import os
 import pathlib
 import shutil
+import subprocess
+import tempfile
 import unittest
 from glob import glob
+from unittest import mock
 
-from github_actions_docs.lib.generator import generate_docs
+from github_actions_docs.cli import build_args_parser, validate_args
+from github_actions_docs.lib import generator
+from github_actions_docs.lib.generator import generate_docs, generate_refs_docs
+from github_actions_docs.lib.git import Git, GitObjects
+from github_actions_docs.lib.parser import GithubActions
+from github_actions_docs.lib.pipeline import generate_docs_async
+from github_actions_docs.lib.styler import UpdateDocsStyle
+from github_actions_docs.lib.watcher import Watcher, watch_docs
 
 
 class TestGenerateDocs(unittest.TestCase):
     def setUp(self):
+        self.copy_input_docs()
+
+    def tearDown(self):
+        self.clean_input_files()
+
+    @staticmethod
+    def copy_input_docs():
         files = glob("tests/input_docs/*.md")
         for sample_file in files:
             shutil.copy(sample_file, "tests/input_files")
 
-    def tearDown(self):
+    @staticmethod
+    def clean_input_files():
         files_to_be_deleted = glob("tests/input_files/*.md")
         for delete_file in files_to_be_deleted:
             os.remove(delete_file)
+        shutil.rmtree("tests/input_files/workflows", ignore_errors=True)
+        for catalog_file in glob("tests/input_files/catalog.json*"):
+            os.remove(catalog_file)
 
     def test_generated_docs_composite_no_readme(self):
         generate_docs(
@@ -130,11 +154,567 @@ class TestGenerateDocs(unittest.TestCase):
         )
         self.assertTrue(comparison)  # generated file content is as expected
 
+    def test_generated_docs_workflow_shards(self):
+        generate_docs(
+            file_paths=["tests/input_files/valid_workflow_1.yaml"],
+            usage_ref_override="main",
+            workflows_docs_dir="tests/input_files/workflows",
+        )
+        generate_docs(
+            file_paths=["tests/input_files/valid_workflow_*.yaml"],
+            usage_ref_override="main",
+            workflows_docs_dir="tests/input_files/workflows",
+        )
+        self.assertFalse(pathlib.Path("tests/input_files/README.md").is_file())
+        for generated, expected in [
+            ("README.md", "WORKFLOW_SHARDS_INDEX.md"),
+            ("valid_workflow_test_2.md", "WORKFLOW_SHARD.md"),
+        ]:
+            comparison = filecmp.cmp(
+                f"tests/input_files/workflows/{generated}",
+                f"tests/output_docs/{expected}",
+            )
+            self.assertTrue(comparison)  # generated file content is as expected
+
+    def test_generated_docs_workflow_shards_update(self):
+        generate_docs(
+            file_paths=["tests/input_files/valid_workflow_1.yaml"],
+            usage_ref_override="main",
+            workflows_docs_dir="tests/input_files/workflows",
+        )
+        generate_docs(
+            file_paths=["tests/input_files/valid_workflow_*.yaml"],
+            usage_ref_override="main",
+            workflows_docs_dir="tests/input_files/workflows",
+        )
+        exit_code = generate_docs(
+            file_paths=["tests/input_files/valid_workflow_1.yaml"],
+            usage_ref_override="main",
+            workflows_docs_dir="tests/input_files/workflows",
+        )
+        self.assertEqual(exit_code, 0)  # nothing changed in shard or index
+        comparison = filecmp.cmp(
+            "tests/input_files/workflows/README.md",
+            "tests/output_docs/WORKFLOW_SHARDS_INDEX.md",
+        )
+        self.assertTrue(comparison)  # index still lists both workflows
+
+    def test_generated_docs_fingerprint(self):
+        exit_code = generate_docs(
+            file_paths=["tests/input_files/valid_composite.yaml"],
+            usage_ref_override="main",
+            fingerprint=True,
+        )
+        self.assertEqual(exit_code, 1)
+        with open("tests/input_files/README.md") as f:
+            fingerprint, content = f.read().split("\n", 1)
+        self.assertRegex(
+            fingerprint,
+            r"^<!-- GH_DOCS_FINGERPRINT [0-9a-f]{64} "
+            r"tests/input_files/valid_composite.yaml -->$",
+        )
+        with open("tests/output_docs/COMPOSITE_README.md") as f:
+            self.assertEqual(content, f.read())
+
+        with mock.patch.object(
+            GithubActions, "__init__", autospec=True, return_value=None
+        ) as github_actions:
+            exit_code = generate_docs(
+                file_paths=["tests/input_files/valid_composite.yaml"],
+                usage_ref_override="main",
+                fingerprint=True,
+            )
+        self.assertEqual(exit_code, 0)
+        github_actions.assert_not_called()  # skipped without parsing
+
+        exit_code = generate_docs(
+            file_paths=["tests/input_files/valid_composite.yaml"],
+            usage_ref_override="v1",
+            fingerprint=True,
+        )
+        self.assertEqual(exit_code, 1)  # options are part of the fingerprint
+
+    def test_generated_docs_fingerprint_shared_readme(self):
+        for path in ["valid_workflow_1.yaml", "valid_workflow_2.yaml"]:
+            generate_docs(
+                file_paths=[f"tests/input_files/{path}"],
+                usage_ref_override="main",
+                fingerprint=True,
+            )
+        fingerprints = generator.read_fingerprints(
+            pathlib.Path("tests/input_files/README.md")
+        )
+        self.assertEqual(
+            sorted(fingerprints),
+            [
+                "tests/input_files/valid_workflow_1.yaml",
+                "tests/input_files/valid_workflow_2.yaml",
+            ],
+        )
+        exit_code = generate_docs(
+            file_paths=["tests/input_files/valid_workflow_*.yaml"],
+            usage_ref_override="main",
+            fingerprint=True,
+        )
+        self.assertEqual(exit_code, 0)
+
+    def test_generated_catalog(self):
+        with mock.patch.object(
+            GithubActions, "parse", autospec=True, side_effect=GithubActions.parse
+        ) as github_actions:
+            generate_docs(
+                file_paths=[
+                    "tests/input_files/valid_composite.yaml",
+                    "tests/input_files/valid_workflow_2.yaml",
+                ],
+                usage_ref_override="main",
+                catalog="tests/input_files/catalog.json",
+            )
+        self.assertEqual(github_actions.call_count, 2)  # parsed once per file
+        with open("tests/input_files/catalog.json") as f:
+            catalog = {i["path"]: i for i in json.load(f)}
+        action = catalog["tests/input_files/valid_composite.yaml"]
+        self.assertEqual(action["name"], "Valid Test")
+        self.assertEqual(action["runs"], "composite")
+        self.assertEqual(action["usage_ref"], "main")
+        self.assertEqual(
+            action["uses"], "rzjfr/github-actions-docs/tests/input_files@main"
+        )
+        self.assertEqual(
+            action["inputs"][0],
+            {
+                "parameter": "tristique",
+                "description": "In pretium at libero in tempor.",
+                "required": "false",
+                "default": '""',
+            },
+        )
+        self.assertEqual(action["secrets"], [])
+        workflow = catalog["tests/input_files/valid_workflow_2.yaml"]
+        self.assertEqual(workflow["runs"], "reusable workflow")
+        self.assertEqual(workflow["secrets"][0]["parameter"], "envPAT")
+        self.assertEqual(len(workflow["outputs"]), 2)
+
+    def test_generated_catalog_json_lines(self):
+        generate_docs(
+            file_paths=["tests/input_files/valid_workflow_*.yaml"],
+            usage_ref_override="main",
+            catalog="tests/input_files/catalog.jsonl",
+        )
+        with open("tests/input_files/catalog.jsonl") as f:
+            names = sorted(json.loads(line)["name"] for line in f)
+        self.assertEqual(names, ["Valid Workflow Test 1", "Valid Workflow Test 2"])
+
+    def test_generated_docs_multiple_targets(self):
+        with (
+            mock.patch.object(
+                GithubActions, "parse", autospec=True, side_effect=GithubActions.parse
+            ) as github_actions,
+            mock.patch.object(
+                UpdateDocsStyle,
+                "_update_docs_style",
+                autospec=True,
+                side_effect=UpdateDocsStyle._update_docs_style,
+            ) as styler,
+        ):
+            generate_docs(
+                file_paths=["tests/input_files/valid_composite.yaml"],
+                docs_filename=["README.md", "DOCS.md:DOCS"],
+                usage_ref_override="main",
+            )
+        self.assertEqual(github_actions.call_count, 1)  # parsed once
+        self.assertEqual(styler.call_count, 1)  # styled once
+        comparison = filecmp.cmp(
+            "tests/input_files/README.md",
+            "tests/output_docs/COMPOSITE_README.md",
+        )
+        self.assertTrue(comparison)  # generated file content is as expected
+        with open("tests/output_docs/COMPOSITE_README.md") as f:
+            expected = f.read().replace("GH_DOCS_", "DOCS_")
+        with open("tests/input_files/DOCS.md") as f:
+            self.assertEqual(f.read(), expected)  # same content, own tag prefix
+
+    def test_generated_docs_multiple_targets_workflow(self):
+        for path in ["valid_workflow_1.yaml", "valid_workflow_2.yaml"]:
+            generate_docs(
+                file_paths=[f"tests/input_files/{path}"],
+                docs_filename=["README.md", "DOCS.md:DOCS"],
+                usage_ref_override="main",
+            )
+        comparison = filecmp.cmp(
+            "tests/input_files/README.md",
+            "tests/output_docs/WORKFLOW_UPDATE_README.md",
+        )
+        self.assertTrue(comparison)  # generated file content is as expected
+        with open("tests/output_docs/WORKFLOW_UPDATE_README.md") as f:
+            expected = f.read().replace("GH_DOCS_", "DOCS_")
+        with open("tests/input_files/DOCS.md") as f:
+            self.assertEqual(f.read(), expected)  # table of contents is kept
+
+    def test_generated_docs_multiple_targets_workflow_shards(self):
+        for path in ["valid_workflow_1.yaml", "valid_workflow_*.yaml"]:
+            generate_docs(
+                file_paths=[f"tests/input_files/{path}"],
+                docs_filename=["README.md", "DOCS.md:DOCS"],
+                usage_ref_override="main",
+                workflows_docs_dir="tests/input_files/workflows",
+            )
+        for generated, expected in [
+            ("README.md", "WORKFLOW_SHARDS_INDEX.md"),
+            ("valid_workflow_test_2.md", "WORKFLOW_SHARD.md"),
+        ]:
+            comparison = filecmp.cmp(
+                f"tests/input_files/workflows/{generated}",
+                f"tests/output_docs/{expected}",
+            )
+            self.assertTrue(comparison)  # first target is the same as without DOCS.md
+        for generated, expected in [
+            ("DOCS.md", "WORKFLOW_SHARDS_INDEX.md"),
+            ("valid_workflow_test_2.docs.md", "WORKFLOW_SHARD.md"),
+        ]:
+            with open(f"tests/output_docs/{expected}") as f:
+                expected = f.read().replace("GH_DOCS_", "DOCS_")
+            expected = expected.replace(".md)", ".docs.md)")  # linked shards
+            with open(f"tests/input_files/workflows/{generated}") as f:
+                self.assertEqual(f.read(), expected)  # own shards, own tag prefix
+
+    def test_generated_docs_workflow_short_triggers(self):
+        workflows_path = pathlib.Path("tests/input_files/workflows")
+        workflows_path.mkdir()
+        for index, triggers in enumerate(["workflow_call", "[workflow_call, push]"]):
+            workflows_path.joinpath(f"workflow_{index}.yaml").write_text(
+                f"name: Short Workflow {index}\non: {triggers}\n"
+                "jobs:\n  test:\n    runs-on: ubuntu-latest\n"
+            )
+        workflows_path.joinpath("push.yaml").write_text(
+            "name: Push\non: [push]\njobs:\n  test:\n    runs-on: ubuntu-latest\n"
+        )
+        exit_code = generate_docs(
+            file_paths=[f"{workflows_path}/workflow_*.yaml"],
+            usage_ref_override="main",
+        )
+        self.assertEqual(exit_code, 1)
+        content = workflows_path.joinpath("README.md").read_text()
+        for index in range(2):
+            self.assertIn(
+                f"- [Short Workflow {index}](#short-workflow-{index})", content
+            )
+        exit_code = generate_docs(  # not a reusable workflow
+            file_paths=[f"{workflows_path}/push.yaml"], usage_ref_override="main"
+        )
+        self.assertEqual(exit_code, 1)
+        self.assertNotIn("Push", workflows_path.joinpath("README.md").read_text())
+
     def test_generate_docs_invalid(self):
         generate_docs(file_paths=["tests/input_files/invalid.yaml"])
         path = pathlib.Path("tests/input_files/README.md")
         self.assertFalse(path.is_file())  # file should not exist
 
 
+class TestGenerateDocsAsync(TestGenerateDocs):
+    """Runs the same scenarios through the asyncio pipeline."""
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch(
+            f"{__name__}.generate_docs",
+            lambda **kwargs: asyncio.run(generate_docs_async(concurrency=2, **kwargs)),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_same_order_and_exit_code(self):
+        file_paths = ["tests/input_files/valid_*.yaml"]
+        results = []
+        for function in [generator.generate_docs, generate_docs]:
+            with self.assertLogs(level="INFO") as logs:
+                exit_code = function(file_paths=file_paths, usage_ref_override="main")
+            results.append((exit_code, [i for i in logs.output if "file:" in i]))
+            self.clean_input_files()  # both start from the same input files
+            self.copy_input_docs()
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0][0], 1)
+
+    def test_invalid_stops_before_later_files(self):
+        # keep the invalid file first
+        with mock.patch(
+            "github_actions_docs.lib.pipeline.expand_file_paths",
+            side_effect=lambda paths: [pathlib.Path(i) for i in paths],
+        ):
+            exit_code = generate_docs(
+                file_paths=[
+                    "tests/input_files/invalid.yaml",
+                    "tests/input_files/valid_composite.yaml",
+                ],
+            )
+        self.assertEqual(exit_code, 1)
+        self.assertFalse(pathlib.Path("tests/input_files/README.md").is_file())
+
+    def test_git_prefetch(self):
+        git, prefetched_git = Git(), Git()
+        asyncio.run(prefetched_git.prefetch())
+        for attribute in ["latest_tag", "remote_url", "current_branch"]:
+            self.assertEqual(
+                getattr(prefetched_git, attribute), getattr(git, attribute)
+            )
+
+
+class GitRepositoryTestCase(unittest.TestCase):
+    """Runs inside a temporary git repository with two tagged commits."""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.repo_path = pathlib.Path(tempfile.mkdtemp())
+        action_path = self.repo_path.joinpath(".github/actions/example")
+        action_path.mkdir(parents=True)
+        shutil.copy("tests/input_files/valid_composite.yaml", action_path)
+        shutil.copy("tests/input_files/valid_workflow_1.yaml", self.repo_path)
+        os.chdir(self.repo_path)
+        self.git("init", "-q")
+        self.git("remote", "add", "origin", "https://github.com/owner/repo.git")
+        self.git("add", ".")
+        self.git("commit", "-qm", "first")
+        self.git("tag", "v1.0.0")
+        pathlib.Path("valid_workflow_1.yaml").write_text(
+            pathlib.Path("valid_workflow_1.yaml")
+            .read_text()
+            .replace("Valid Workflow Test 1", "Valid Workflow Test 1 Renamed")
+        )
+        self.git("commit", "-qam", "second")
+        self.git("tag", "v1.1.0")
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.repo_path)
+
+    def git(self, *args) -> str:
+        return subprocess.check_output(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@test", *args]
+        ).decode()
+
+
+class TestGenerateRefsDocs(GitRepositoryTestCase):
+    def test_generated_docs_refs(self):
+        with mock.patch.object(
+            generator, "GithubActions", wraps=generator.GithubActions
+        ) as github_actions:
+            exit_code = generate_refs_docs(
+                file_paths=["*.yaml"],
+                refs=["v1.0.0", "v1.1.0"],
+                refs_docs_dir="out",
+            )
+        self.assertEqual(exit_code, 1)
+        # the unchanged action is loaded once for both refs
+        self.assertEqual(github_actions.call_count, 3)
+        for ref in ["v1.0.0", "v1.1.0"]:
+            content = pathlib.Path(
+                f"out/{ref}/.github/actions/example/README.md"
+            ).read_text()
+            self.assertIn(f"uses: owner/repo/.github/actions/example@{ref}", content)
+        old = pathlib.Path("out/v1.0.0/README.md").read_text()
+        new = pathlib.Path("out/v1.1.0/README.md").read_text()
+        self.assertNotIn("Renamed", old)
+        self.assertIn("Renamed", new)
+        worktree_status = self.git("status", "--porcelain")
+        self.assertEqual(worktree_status, "?? out/\n")  # worktree untouched
+
+    def test_generated_docs_refs_invalid_blobs(self):
+        pathlib.Path("dependabot.yaml").write_text("version: 2\n")
+        pathlib.Path("latin1.yaml").write_bytes("name: caf\xe9\n".encode("latin-1"))
+        self.git("add", ".")
+        self.git("commit", "-qm", "invalid files")
+        self.git("tag", "v1.2.0")
+        self.git("commit", "-q", "--allow-empty", "-m", "nothing")
+        self.git("tag", "v1.3.0")
+        with mock.patch.object(
+            GitObjects, "read_blob", autospec=True, side_effect=GitObjects.read_blob
+        ) as read_blob:
+            exit_code = generate_refs_docs(
+                file_paths=["*.yaml"],
+                refs=["v1.2.0", "v1.3.0"],
+                refs_docs_dir="out",
+                ignore=True,
+            )
+        self.assertEqual(exit_code, 1)
+        object_ids = [i.args[1] for i in read_blob.call_args_list]
+        self.assertEqual(len(object_ids), 4)  # every blob is read once
+        self.assertEqual(len(set(object_ids)), 4)
+
+
+class TestUsageRefStrategy(GitRepositoryTestCase):
+    def test_generated_docs_last_commit(self):
+        first_commit = self.git("rev-parse", "v1.0.0").strip()
+        second_commit = self.git("rev-parse", "v1.1.0").strip()
+        generate_docs(
+            file_paths=[".github/actions/example/valid_composite.yaml"],
+            usage_ref_strategy="last-commit",
+        )
+        content = pathlib.Path(".github/actions/example/README.md").read_text()
+        self.assertIn(
+            f"uses: owner/repo/.github/actions/example@{first_commit}", content
+        )
+
+        generate_docs(
+            file_paths=["valid_workflow_1.yaml"],
+            usage_ref_strategy="last-commit",
+        )
+        content = pathlib.Path("README.md").read_text()
+        self.assertIn(f"valid_workflow_1.yaml@{second_commit}", content)
+
+    def test_last_commits_single_walk_cached(self):
+        first_commit = self.git("rev-parse", "v1.0.0").strip()
+        git = Git()
+        with mock.patch.object(git, "_walk_history", wraps=git._walk_history) as walk:
+            result = git.last_commits([".github/actions/example", "missing"])
+            self.assertEqual(walk.call_count, 1)  # one history walk
+            self.assertEqual(
+                result, {".github/actions/example": first_commit, "missing": None}
+            )
+            git.last_commits([".github/actions/example"])
+            self.assertEqual(walk.call_count, 1)  # served from cache
+
+    def test_generated_docs_last_commit_outside_repository(self):
+        outside_path = pathlib.Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, outside_path)
+        shutil.copy(
+            pathlib.Path(".github/actions/example/valid_composite.yaml"), outside_path
+        )
+        generate_docs(
+            file_paths=[str(outside_path.joinpath("valid_composite.yaml"))],
+            usage_ref_strategy="last-commit",
+        )
+        content = outside_path.joinpath("README.md").read_text()
+        self.assertIn(f"{outside_path}@v1.1.0", content)  # falls back to latest tag
+
+    def test_generated_docs_last_commit_fingerprint_skip(self):
+        options = {
+            "file_paths": ["*.yaml", ".github/actions/example/*.yaml"],
+            "usage_ref_strategy": "last-commit",
+            "fingerprint": True,
+        }
+        self.assertEqual(generate_docs(**options), 1)
+        with (
+            mock.patch.object(Git, "_run_command") as run_command,
+            mock.patch.object(Git, "_run_command_async") as run_command_async,
+        ):
+            self.assertEqual(generate_docs(**options), 0)
+            self.assertEqual(asyncio.run(generate_docs_async(**options)), 0)
+        run_command.assert_not_called()  # no git metadata for skipped files
+        run_command_async.assert_not_called()
+
+
+class TestWatcher(unittest.TestCase):
+    def setUp(self):
+        self.watch_path = pathlib.Path(tempfile.mkdtemp())
+        shutil.copy("tests/input_files/valid_composite.yaml", self.watch_path)
+        shutil.copy("tests/input_files/valid_workflow_1.yaml", self.watch_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.watch_path)
+
+    def test_watcher_poll(self):
+        watcher = Watcher([str(self.watch_path)])  # directories are expanded
+        self.assertEqual(len(watcher.snapshot), 2)
+        self.assertEqual(watcher.poll(), set())
+        composite_path = self.watch_path.joinpath("valid_composite.yaml")
+        with open(composite_path, "a") as f:
+            f.write("\n")
+        new_path = self.watch_path.joinpath("valid_workflow_2.yaml")
+        shutil.copy("tests/input_files/valid_workflow_2.yaml", new_path)
+        self.watch_path.joinpath("README.md").write_text("ignored")
+        self.assertEqual(watcher.poll(), {composite_path, new_path})
+        self.assertEqual(watcher.poll(), set())
+
+    def test_watch_docs_regenerates_changed_files_only(self):
+        composite_path = self.watch_path.joinpath("valid_composite.yaml")
+
+        def sleep(seconds):
+            sleep.calls += 1
+            if sleep.calls == 1:
+                with open(composite_path, "a") as f:
+                    f.write("\n")
+            elif sleep.calls > 3:
+                raise KeyboardInterrupt
+
+        sleep.calls = 0
+        with (
+            mock.patch("time.sleep", sleep),
+            mock.patch("github_actions_docs.lib.watcher.generate_docs") as generate,
+        ):
+            exit_code = watch_docs([str(self.watch_path)], usage_ref_override="main")
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(generate.call_count, 3)  # both files, then the changed one
+        self.assertEqual(
+            generate.call_args_list[2].kwargs["file_paths"], [str(composite_path)]
+        )
+        git = generate.call_args_list[0].kwargs["git"]
+        self.assertIs(generate.call_args_list[2].kwargs["git"], git)  # reused
+
+    def test_watch_docs_skips_invalid_files(self):
+        github_path = self.watch_path.joinpath(".github")
+        action_path = github_path.joinpath("actions/example")
+        workflows_path = github_path.joinpath("workflows")
+        action_path.mkdir(parents=True)
+        workflows_path.mkdir()
+        self.watch_path.joinpath("valid_composite.yaml").rename(
+            action_path.joinpath("action.yaml")
+        )
+        self.watch_path.joinpath("valid_workflow_1.yaml").rename(
+            workflows_path.joinpath("valid_workflow_1.yaml")
+        )
+        github_path.joinpath("dependabot.yml").write_text("version: 2\nupdates: []\n")
+        workflows_path.joinpath("ci.yaml").write_text(
+            "name: CI\non: [push]\njobs:\n  test:\n    runs-on: ubuntu-latest\n"
+        )
+        with mock.patch("time.sleep", side_effect=KeyboardInterrupt):
+            exit_code = watch_docs([str(github_path)], usage_ref_override="main")
+        self.assertEqual(exit_code, 0)
+        self.assertTrue(action_path.joinpath("README.md").is_file())
+        content = workflows_path.joinpath("README.md").read_text()
+        self.assertIn("Valid Workflow Test 1", content)
+        self.assertNotIn("CI", content)
+
+    def test_watch_docs_broken_file_in_batch(self):
+        broken_path = self.watch_path.joinpath("a")
+        valid_path = self.watch_path.joinpath("b")
+        broken_path.mkdir()
+        valid_path.mkdir()
+        broken_path.joinpath("action.yaml").write_text("name: [broken\n")  # mid edit
+        self.watch_path.joinpath("valid_composite.yaml").rename(
+            valid_path.joinpath("action.yaml")
+        )
+        with (
+            mock.patch("time.sleep", side_effect=KeyboardInterrupt),
+            mock.patch(  # keep the broken file first
+                "github_actions_docs.lib.generator.expand_file_paths",
+                side_effect=lambda paths: [pathlib.Path(i) for i in paths],
+            ),
+        ):
+            exit_code = watch_docs(
+                [f"{self.watch_path}/*/action.yaml"], usage_ref_override="main"
+            )
+        self.assertEqual(exit_code, 0)
+        self.assertFalse(broken_path.joinpath("README.md").is_file())
+        self.assertTrue(valid_path.joinpath("README.md").is_file())
+
+
+class TestCli(unittest.TestCase):
+    def test_unsupported_options(self):
+        parser = build_args_parser(description="", version="")
+        for argv in [
+            ["--refs", "v1.0.0", "--catalog", "catalog.json"],
+            ["--refs", "v1.0.0", "--usage-ref-strategy", "last-commit"],
+            ["--watch", "--concurrency", "4"],
+        ]:
+            args = parser.parse_args([*argv, "action.yaml"])
+            with (
+                self.assertRaises(SystemExit),
+                mock.patch("sys.stderr", new_callable=io.StringIO),
+            ):
+                validate_args(parser, args)
+        for argv in [["--refs", "v1.0.0", "--ignore"], ["--watch", "--fingerprint"]]:
+            validate_args(parser, parser.parse_args([*argv, "action.yaml"]))
+
+
 if __name__ == "__main__":
     unittest.main()